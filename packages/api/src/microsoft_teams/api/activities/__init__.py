@@ -5,7 +5,7 @@ Licensed under the MIT License.
 
 from typing import Annotated, Union
 
-from pydantic import Field, TypeAdapter
+from pydantic import ConfigDict, Field, TypeAdapter
 
 from . import event, install_update, invoke, message
 from .activity_params import ActivityParams
@@ -41,8 +41,8 @@ Activity = Annotated[
 ]
 
 # Use this if you want to validate an incoming activity.
-ActivityTypeAdapter = TypeAdapter[Activity](Activity)
-ActivityTypeAdapter.rebuild()
+# The core schema is built on first validation rather than at import time.
+ActivityTypeAdapter = TypeAdapter[Activity](Activity, config=ConfigDict(defer_build=True))
 
 
 # Combine all exports from submodules
@@ -14,11 +14,12 @@ from .message import (
 )
 from .typing import TypingActivityInput
 
+# Listed by expected outbound traffic
 ActivityParams = Annotated[
     Union[
         MessageActivityInput,
-        MessageReactionActivityInput,
         TypingActivityInput,
+        MessageReactionActivityInput,
     ],
     Field(discriminator="type"),
 ]
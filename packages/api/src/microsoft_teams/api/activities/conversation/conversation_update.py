@@ -23,7 +23,7 @@ ConversationEventType = Literal[
 ]
 
 
-class ConversationChannelData(ChannelData, CustomBaseModel):
+class ConversationChannelData(ChannelData):
     """Extended ChannelData with event type."""
 
     event_type: Optional[ConversationEventType] = None
@@ -28,7 +28,7 @@ class MeetingEndEventValue(CustomBaseModel):
     """Timestamp for meeting end, in UTC."""
 
 
-class MeetingEndEventActivity(ActivityBase, CustomBaseModel):
+class MeetingEndEventActivity(ActivityBase):
     """
     Represents a meeting end event activity in Microsoft Teams.
     """
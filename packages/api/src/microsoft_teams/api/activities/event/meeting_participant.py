@@ -37,7 +37,7 @@ class MeetingParticipantEventValue(CustomBaseModel):
     """The list of participants in the meeting."""
 
 
-class MeetingParticipantEventActivity(ActivityBase, CustomBaseModel):
+class MeetingParticipantEventActivity(ActivityBase):
     """
     Represents a meeting participant event activity in Microsoft Teams.
     """
@@ -5,11 +5,10 @@ Licensed under the MIT License.
 
 from typing import Literal
 
-from ...models import CustomBaseModel
 from .meeting_participant import MeetingParticipantEventActivity
 
 
-class MeetingParticipantJoinEventActivity(MeetingParticipantEventActivity, CustomBaseModel):
+class MeetingParticipantJoinEventActivity(MeetingParticipantEventActivity):
     name: Literal["application/vnd.microsoft.meetingParticipantJoin"] = (
         "application/vnd.microsoft.meetingParticipantJoin"
     )
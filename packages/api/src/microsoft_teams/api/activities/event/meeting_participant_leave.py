@@ -5,11 +5,10 @@ Licensed under the MIT License.
 
 from typing import Literal
 
-from ...models import CustomBaseModel
 from .meeting_participant import MeetingParticipantEventActivity
 
 
-class MeetingParticipantLeaveEventActivity(MeetingParticipantEventActivity, CustomBaseModel):
+class MeetingParticipantLeaveEventActivity(MeetingParticipantEventActivity):
     name: Literal["application/vnd.microsoft.meetingParticipantLeave"] = (
         "application/vnd.microsoft.meetingParticipantLeave"
     )
@@ -42,7 +42,7 @@ class MeetingStartEventValue(CustomBaseModel):
     """
 
 
-class MeetingStartEventActivity(ActivityBase, CustomBaseModel):
+class MeetingStartEventActivity(ActivityBase):
     """
     Represents a meeting start event activity in Microsoft Teams.
     """
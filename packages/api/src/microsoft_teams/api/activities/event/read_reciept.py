@@ -6,10 +6,10 @@ Licensed under the MIT License.
 from abc import ABC
 from typing import Literal
 
-from ...models import ActivityBase, CustomBaseModel
+from ...models import ActivityBase
 
 
-class ReadReceiptEventActivity(ActivityBase, CustomBaseModel, ABC):
+class ReadReceiptEventActivity(ActivityBase, ABC):
     """
     Represents a read receipt event activity in Microsoft Teams.
     """
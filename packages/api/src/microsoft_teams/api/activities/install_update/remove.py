@@ -5,10 +5,10 @@ Licensed under the MIT License.
 
 from typing import Literal
 
-from ...models import ActivityBase, CustomBaseModel
+from ...models import ActivityBase
 
 
-class UninstalledActivity(ActivityBase, CustomBaseModel):
+class UninstalledActivity(ActivityBase):
     type: Literal["installationUpdate"] = "installationUpdate"  #
 
     action: Literal["remove"] = "remove"
@@ -5,11 +5,10 @@ Licensed under the MIT License.
 
 from typing import Any, Literal
 
-from ....models import CustomBaseModel
 from ...invoke_activity import InvokeActivity
 
 
-class ConfigFetchInvokeActivity(InvokeActivity, CustomBaseModel):
+class ConfigFetchInvokeActivity(InvokeActivity):
     """
     Represents the config fetch invoke activity.
     """
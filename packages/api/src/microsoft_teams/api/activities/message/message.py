@@ -236,12 +236,12 @@ class MessageActivityInput(_MessageBase, ActivityInputBase):
         Returns:
             Self for method chaining
         """
-        mention_text = text or account.name
+        mention_tag = f"<at>{text or account.name}</at>"
 
         if add_text:
-            self.add_text(f"<at>{mention_text}</at>")
+            self.add_text(mention_tag)
 
-        mention_entity = MentionEntity(mentioned=account, text=f"<at>{mention_text}</at>")
+        mention_entity = MentionEntity(mentioned=account, text=mention_tag)
 
         return self.add_entity(mention_entity)
 
@@ -308,14 +308,12 @@ class MessageActivityInput(_MessageBase, ActivityInputBase):
         """
 
         # Update channel data
-        if not self.channel_data:
+        if self.channel_data is None:
             self.channel_data = ChannelData()
 
         # Set stream properties on channel data
-        if hasattr(self.channel_data, "stream_id"):
-            self.channel_data.stream_id = self.id
-        if hasattr(self.channel_data, "stream_type"):
-            self.channel_data.stream_type = "final"
+        self.channel_data.stream_id = self.id
+        self.channel_data.stream_type = "final"
 
         # Add stream info entity
         stream_entity = StreamInfoEntity(type="streaminfo", stream_id=self.id, stream_type="final")
@@ -0,0 +1,32 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+# pyright: basic
+
+import pytest
+from microsoft_teams.api.activities import (
+    ActivityParams,
+    MessageActivityInput,
+    MessageReactionActivityInput,
+    TypingActivityInput,
+)
+from pydantic import TypeAdapter
+
+
+@pytest.mark.unit
+class TestActivityParams:
+    """Unit tests for the ActivityParams union."""
+
+    @pytest.mark.parametrize(
+        ("activity_type", "expected_class"),
+        [
+            ("message", MessageActivityInput),
+            ("typing", TypingActivityInput),
+            ("messageReaction", MessageReactionActivityInput),
+        ],
+    )
+    def test_type_selects_input_model(self, activity_type: str, expected_class: type) -> None:
+        activity = TypeAdapter(ActivityParams).validate_python({"type": activity_type})
+
+        assert type(activity) is expected_class
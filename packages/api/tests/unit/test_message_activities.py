@@ -378,6 +378,8 @@ class TestMessageActivity:
 
         # Should use existing channel data
         assert activity.channel_data is not None
+        assert activity.channel_data.stream_id == "stream-msg-456"
+        assert activity.channel_data.stream_type == "final"
 
     def test_complex_message_building(self):
         """Test building a complex message with multiple features"""
@@ -3,7 +3,7 @@ Copyright (c) Microsoft Corporation. All rights reserved.
 Licensed under the MIT License.
 """
 
-from typing import List
+from typing import List, Literal
 
 from microsoft_teams.common import EventEmitter
 
@@ -11,6 +11,11 @@ from .events import ActivityEvent, ActivityResponseEvent, ActivitySentEvent, Err
 from .plugins import PluginActivityResponseEvent, PluginActivitySentEvent, PluginBase, PluginErrorEvent
 
 
+def _overrides_hook(plugin: PluginBase, hook: Literal["on_activity_sent", "on_activity_response"]) -> bool:
+    """Whether the plugin replaces the no-op `PluginBase` implementation of a hook."""
+    return getattr(getattr(plugin, hook), "__func__", None) is not getattr(PluginBase, hook)
+
+
 class EventManager:
     def __init__(self, event_emitter: EventEmitter[EventType]):
         self.event_emitter = event_emitter
@@ -26,21 +31,24 @@ class EventManager:
         self.event_emitter.emit("activity", event)
 
     async def on_activity_sent(self, event: ActivitySentEvent, plugins: List[PluginBase]) -> None:
-        for plugin in plugins:
-            if callable(plugin.on_activity_sent):
-                await plugin.on_activity_sent(
-                    PluginActivitySentEvent(activity=event.activity, conversation_ref=event.conversation_ref)
-                )
+        listeners = [p for p in plugins if _overrides_hook(p, "on_activity_sent") and callable(p.on_activity_sent)]
+        if listeners:
+            # Plugin events are immutable, so one instance is shared by every listener
+            plugin_event = PluginActivitySentEvent(activity=event.activity, conversation_ref=event.conversation_ref)
+            for plugin in listeners:
+                await plugin.on_activity_sent(plugin_event)
         self.event_emitter.emit("activity_sent", event)
 
     async def on_activity_response(self, event: ActivityResponseEvent, plugins: List[PluginBase]) -> None:
-        for plugin in plugins:
-            if callable(plugin.on_activity_response):
-                await plugin.on_activity_response(
-                    PluginActivityResponseEvent(
-                        activity=event.activity,
-                        response=event.response,
-                        conversation_ref=event.conversation_ref,
-                    )
-                )
+        listeners = [
+            p for p in plugins if _overrides_hook(p, "on_activity_response") and callable(p.on_activity_response)
+        ]
+        if listeners:
+            plugin_event = PluginActivityResponseEvent(
+                activity=event.activity,
+                response=event.response,
+                conversation_ref=event.conversation_ref,
+            )
+            for plugin in listeners:
+                await plugin.on_activity_response(plugin_event)
         self.event_emitter.emit("activity_response", event)
@@ -15,7 +15,7 @@ from microsoft_teams.apps import (
     ErrorEvent,
     PluginBase,
 )
-from microsoft_teams.apps.app_events import EventManager
+from microsoft_teams.apps.app_events import EventManager, _overrides_hook
 from microsoft_teams.apps.events import CoreActivity
 from microsoft_teams.apps.events.registry import get_event_name_from_type, get_event_type_from_signature
 from microsoft_teams.common import EventEmitter
@@ -92,6 +92,30 @@ class TestEventManager:
                 plugin.on_activity_response.assert_called()
         mock_event_emitter.emit.assert_called_once_with("activity_response", activity_response_event)
 
+    @pytest.mark.asyncio
+    async def test_on_activity_sent_skips_plugins_without_override(self, event_manager, mock_event_emitter):
+        """Plugins that keep the PluginBase no-op hook are not awaited."""
+        received = []
+
+        class ListeningPlugin(PluginBase):
+            async def on_activity_sent(self, event):
+                received.append(event)
+
+        class SilentPlugin(PluginBase):
+            pass
+
+        activity_sent_event = ActivitySentEvent(
+            activity=MagicMock(spec=SentActivity), conversation_ref=MagicMock(spec=ConversationReference)
+        )
+
+        await event_manager.on_activity_sent(activity_sent_event, [SilentPlugin(), ListeningPlugin()])
+
+        assert not _overrides_hook(SilentPlugin(), "on_activity_sent")
+        assert _overrides_hook(ListeningPlugin(), "on_activity_sent")
+        assert len(received) == 1
+        assert received[0].activity is activity_sent_event.activity
+        mock_event_emitter.emit.assert_called_once_with("activity_sent", activity_sent_event)
+
 
 class TestGetEventNameFromType:
     """Test cases for the get_event_name_from_type function."""
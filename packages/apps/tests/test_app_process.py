@@ -364,6 +364,69 @@ class TestActivityProcessor:
         with pytest.raises(ValueError, match="EventManager was not initialized"):
             await activity_processor.process_activity([], mock_activity_event)
 
+    @pytest.mark.asyncio
+    async def test_process_activity_drops_top_level_nulls(self, activity_processor):
+        """Top-level null values in the payload fall back to model defaults."""
+        core_activity = CoreActivity(
+            type="message",
+            id="activity-null",
+            service_url="https://service.url",
+            **{
+                "from": {"id": "user-1", "name": "Test User"},
+                "conversation": {"id": "conv-1"},
+                "recipient": {"id": "bot-1", "name": "Test Bot"},
+                "channelId": "msteams",
+                "text": None,
+                "channelData": {"tenant": None},
+            },
+        )
+        mock_token = MagicMock(spec=TokenProtocol)
+        mock_token.service_url = "https://service.url"
+        mock_activity_event = ActivityEvent(body=core_activity, token=mock_token)
+
+        activity_processor.router.select_handlers = MagicMock(return_value=[])
+        activity_processor.execute_middleware_chain = AsyncMock(return_value=None)
+        activity_processor.event_manager = MagicMock()
+        activity_processor.event_manager.on_activity_response = AsyncMock()
+
+        await activity_processor.process_activity([], mock_activity_event)
+
+        ctx = activity_processor.execute_middleware_chain.call_args.args[0]
+        assert ctx.activity.text == ""
+        assert ctx.activity.service_url == "https://service.url"
+        assert ctx.activity.channel_data.tenant is None
+
+    @pytest.mark.asyncio
+    async def test_process_activity_does_not_share_nested_body_values(self, activity_processor):
+        """The validated activity gets its own copy of nested payload values, not the request body's."""
+        core_activity = CoreActivity(
+            type="invoke",
+            id="activity-config",
+            service_url="https://service.url",
+            **{
+                "name": "config/fetch",
+                "from": {"id": "user-1", "name": "Test User"},
+                "conversation": {"id": "conv-1"},
+                "recipient": {"id": "bot-1", "name": "Test Bot"},
+                "channelId": "msteams",
+                "value": {"data": {"setting": "on"}},
+            },
+        )
+        mock_token = MagicMock(spec=TokenProtocol)
+        mock_token.service_url = "https://service.url"
+        mock_activity_event = ActivityEvent(body=core_activity, token=mock_token)
+
+        activity_processor.router.select_handlers = MagicMock(return_value=[])
+        activity_processor.execute_middleware_chain = AsyncMock(return_value=None)
+        activity_processor.event_manager = MagicMock()
+        activity_processor.event_manager.on_activity_response = AsyncMock()
+
+        await activity_processor.process_activity([], mock_activity_event)
+
+        ctx = activity_processor.execute_middleware_chain.call_args.args[0]
+        assert ctx.activity.value == mock_activity_event.body.value
+        assert ctx.activity.value is not mock_activity_event.body.value
+
     @pytest.mark.asyncio
     async def test_process_activity_handles_stream_cancelled(self, activity_processor):
         """StreamCancelledError from middleware is caught; response status is 200."""
@@ -6,7 +6,7 @@ Licensed under the MIT License.
 import asyncio
 import inspect
 import logging
-from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Protocol, TypedDict, TypeVar, Union
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Protocol, TypedDict, TypeVar, Union, cast
 
 EventTypeT = TypeVar("EventTypeT", bound=str, contravariant=True)
 
@@ -23,6 +23,7 @@ class Subscription(TypedDict):
 
     id: int
     handler: EventHandler
+    is_async: bool
 
 
 class EventEmitterProtocol(Protocol, Generic[EventTypeT]):
@@ -49,6 +50,9 @@ class EventEmitter(EventEmitterProtocol[EventTypeT]):
 
     Provides both synchronous and asynchronous event emission capabilities.
     Thread-safe for single-threaded use cases.
+
+    Subscription lists are copy-on-write: on() and off() replace an event's list
+    instead of mutating it, so emit() can iterate without taking a copy.
     """
 
     def __init__(self) -> None:
@@ -67,11 +71,9 @@ class EventEmitter(EventEmitterProtocol[EventTypeT]):
             Subscription ID for removing the handler later
         """
         subscription_id = self._get_next_id()
-
-        if event not in self._subscriptions:
-            self._subscriptions[event] = []
-
-        self._subscriptions[event].append({"id": subscription_id, "handler": handler})
+        self._add_subscription(
+            event, {"id": subscription_id, "handler": handler, "is_async": inspect.iscoroutinefunction(handler)}
+        )
 
         logger.debug("Registered handler for event '%s' with id %d", event, subscription_id)
         return subscription_id
@@ -100,11 +102,10 @@ class EventEmitter(EventEmitterProtocol[EventTypeT]):
                 handler(value)
 
         subscription_id = self._get_next_id()
-
-        if event not in self._subscriptions:
-            self._subscriptions[event] = []
-
-        self._subscriptions[event].append({"id": subscription_id, "handler": once_wrapper})
+        self._add_subscription(
+            event,
+            {"id": subscription_id, "handler": once_wrapper, "is_async": inspect.iscoroutinefunction(once_wrapper)},
+        )
 
         logger.debug("Registered one-time handler for event '%s' with id %d", event, subscription_id)
         return subscription_id
@@ -116,13 +117,15 @@ class EventEmitter(EventEmitterProtocol[EventTypeT]):
         Args:
             subscription_id: ID returned from on() or once()
         """
-        for event_name, subscriptions in list(self._subscriptions.items()):
+        for event_name, subscriptions in self._subscriptions.items():
             for i, subscription in enumerate(subscriptions):
                 if subscription["id"] == subscription_id:
-                    subscriptions.pop(i)
-                    logger.debug("Removed handler with id %d from event '%s'", subscription_id, event_name)
-                    if not subscriptions:
+                    remaining = subscriptions[:i] + subscriptions[i + 1 :]
+                    if remaining:
+                        self._subscriptions[event_name] = remaining
+                    else:
                         del self._subscriptions[event_name]
+                    logger.debug("Removed handler with id %d from event '%s'", subscription_id, event_name)
                     return
 
     def emit(self, event: EventTypeT, value: Any = None) -> None:
@@ -135,20 +138,22 @@ class EventEmitter(EventEmitterProtocol[EventTypeT]):
             event: Event name to emit
             value: Data to pass to event handlers
         """
-        if event not in self._subscriptions:
+        subscriptions = self._subscriptions.get(event)
+        if not subscriptions:
             return
 
-        handler_count = len(self._subscriptions[event])
-        logger.debug("Emitting event '%s' to %d handler(s)", event, handler_count)
+        logger.debug("Emitting event '%s' to %d handler(s)", event, len(subscriptions))
 
         awaitables: list[Awaitable[None]] = []
 
-        for subscription in self._subscriptions[event][:]:  # Copy to avoid modification during iteration
+        # Subscription lists are replaced rather than mutated, so handlers calling on()/off() can't affect this loop
+        for subscription in subscriptions:
             try:
                 handler = subscription["handler"]
 
-                if inspect.iscoroutinefunction(handler):
-                    awaitables.append(handler(value))
+                # Sync vs. async is resolved once at registration, not on every emit
+                if subscription["is_async"]:
+                    awaitables.append(cast(Awaitable[None], handler(value)))
                 else:
                     handler(value)
             except Exception as e:
@@ -212,6 +217,10 @@ class EventEmitter(EventEmitterProtocol[EventTypeT]):
             del self._subscriptions[event]
             logger.debug("Removed all %d handler(s) from event '%s'", handler_count, event)
 
+    def _add_subscription(self, event: str, subscription: Subscription) -> None:
+        """Add a subscription by replacing the event's list (copy-on-write)."""
+        self._subscriptions[event] = [*self._subscriptions.get(event, []), subscription]
+
     def _get_next_id(self) -> int:
         """Get next unique subscription ID."""
         self._index += 1
@@ -167,6 +167,20 @@ class TestEventEmitter:
 
         handler.assert_called_once_with("test_data")
 
+    def test_once_with_async_handler(self):
+        emitter = EventEmitter()
+        handler = Mock()
+
+        async def async_handler(data):
+            handler(data)
+
+        emitter.once("test_event", async_handler)
+        emitter.emit("test_event", "data1")
+        emitter.emit("test_event", "data2")
+
+        handler.assert_called_once_with("data1")
+        assert emitter.listener_count("test_event") == 0
+
     def test_emit_with_mixed_handlers(self):
         emitter = EventEmitter()
         sync_handler = Mock()
@@ -257,3 +271,25 @@ class TestEventEmitter:
         assert emitter.listener_count("event2") == 1
         assert "event1" not in emitter.event_names()
         assert "event2" in emitter.event_names()
+
+    def test_subscription_changes_during_emit_apply_to_next_emit(self):
+        emitter = EventEmitter()
+        late_handler = Mock()
+        removed_handler = Mock()
+
+        def handler(data):
+            emitter.on("test_event", late_handler)
+            emitter.off(removed_id)
+
+        emitter.on("test_event", handler)
+        removed_id = emitter.on("test_event", removed_handler)
+
+        emitter.emit("test_event", "data1")
+
+        removed_handler.assert_called_once_with("data1")
+        late_handler.assert_not_called()
+
+        emitter.emit("test_event", "data2")
+
+        removed_handler.assert_called_once_with("data1")
+        late_handler.assert_called_once_with("data2")